@@ -14,6 +14,17 @@ const { getSignedUrl } = require("@aws-sdk/s3-request-presigner");
 const fetch = require("node-fetch");
 const logger = require('./config/logger');
 const { transformProjectToCSVFormat } = require('./utilities/projectDataTransformer');
+const {
+  requestTimings,
+  getSlowRequests,
+  requireDiagnosticsToken,
+  captureCpuProfile,
+  captureHeapSnapshot,
+} = require("./utilities/diagnostics");
+const {
+  createAdmissionLimiter,
+  getAdmissionStats,
+} = require("./utilities/admissionControl");
 
 const app = express();
 const port = process.env.PORT || 5001;
@@ -24,14 +35,33 @@ app.use(
   cors({
     origin: "*",
     methods: ["GET", "POST", "OPTIONS"],
-    allowedHeaders: ["Content-Type", "Authorization"],
+    allowedHeaders: ["Content-Type", "Authorization", "If-None-Match"],
+    // Lets the frontend data cache revalidate responses with If-None-Match
+    exposedHeaders: ["ETag"],
   })
 );
 
 app.use(express.json());
+app.use(requestTimings);
 
 const s3Client = new S3Client({
   region: "eu-west-2",
+  // Allows pointing at a local S3 stand-in, e.g. for load testing
+  ...(process.env.S3_ENDPOINT && {
+    endpoint: process.env.S3_ENDPOINT,
+    forcePathStyle: true,
+  }),
+});
+
+// Admission control for routes that fetch and process data from S3.
+// /api/health and the diagnostics routes are deliberately not limited.
+const csvLimiter = createAdmissionLimiter("csv");
+const techRadarLimiter = createAdmissionLimiter("tech-radar", { maxConcurrent: 8 });
+const statsLimiter = createAdmissionLimiter("json");
+const repositoryLimiter = createAdmissionLimiter("repository");
+const updateLimiter = createAdmissionLimiter("tech-radar-update", {
+  maxConcurrent: 2,
+  maxQueue: 5,
 });
 
 /**
@@ -39,8 +69,9 @@ const s3Client = new S3Client({
  * @route GET /api/csv
  * @returns {Object[]} Array of objects containing parsed project data in CSV format
  * @throws {Error} 500 - If data fetching or processing fails
+ * @throws {Error} 503 - If the server is busy, with a Retry-After header
  */
-app.get("/api/csv", async (req, res) => {
+app.get("/api/csv", csvLimiter, async (req, res) => {
   try {
     const command = new GetObjectCommand({
       Bucket: tatBucketName,
@@ -51,12 +82,18 @@ app.get("/api/csv", async (req, res) => {
 
     // Fetch the JSON data using the signed URL
     const response = await fetch(signedUrl);
-    const jsonData = await response.json();
+    // Read the body before marking, as fetch resolves once headers arrive
+    const text = await response.text();
+    req.timings.mark("s3_fetch");
+    const jsonData = JSON.parse(text);
+    req.timings.mark("parse");
 
     // Transform JSON data to CSV format using the utility function
     const transformedData = jsonData.projects.map(transformProjectToCSVFormat);
+    req.timings.mark("transform");
 
     res.json(transformedData);
+    req.timings.mark("serialize");
   } catch (error) {
     logger.error("Error fetching and transforming project data:", { error: error.message });
     res.status(500).json({ error: error.message });
@@ -68,8 +105,9 @@ app.get("/api/csv", async (req, res) => {
  * @route GET /api/tech-radar/json
  * @returns {Object} The tech radar configuration data
  * @throws {Error} 500 - If JSON fetching fails
+ * @throws {Error} 503 - If the server is busy, with a Retry-After header
  */
-app.get("/api/tech-radar/json", async (req, res) => {
+app.get("/api/tech-radar/json", techRadarLimiter, async (req, res) => {
   try {
     const command = new GetObjectCommand({
       Bucket: bucketName,
@@ -81,9 +119,14 @@ app.get("/api/tech-radar/json", async (req, res) => {
     // Fetch the CSV data using the signed URL
     // Just return the json, no need for formatting
     const response = await fetch(signedUrl);
-    const jsonData = await response.json();
+    // Read the body before marking, as fetch resolves once headers arrive
+    const text = await response.text();
+    req.timings.mark("s3_fetch");
+    const jsonData = JSON.parse(text);
+    req.timings.mark("parse");
 
     res.json(jsonData);
+    req.timings.mark("serialize");
   } catch (error) {
     console.error("Error fetching JSON:", error);
     res.status(500).json({ error: error.message });
@@ -100,8 +143,9 @@ app.get("/api/tech-radar/json", async (req, res) => {
  * @returns {Object} response.language_statistics - Language usage statistics across repositories
  * @returns {Object} response.metadata - Last updated timestamp and filter information
  * @throws {Error} 500 - If JSON fetching fails
+ * @throws {Error} 503 - If the server is busy, with a Retry-After header
  */
-app.get("/api/json", async (req, res) => {
+app.get("/api/json", statsLimiter, async (req, res) => {
   try {
     const { datetime, archived } = req.query;
     const command = new GetObjectCommand({
@@ -113,7 +157,11 @@ app.get("/api/json", async (req, res) => {
 
     // Fetch the JSON data using the signed URL
     const response = await fetch(signedUrl);
-    const jsonData = await response.json();
+    // Read the body before marking, as fetch resolves once headers arrive
+    const text = await response.text();
+    req.timings.mark("s3_fetch");
+    const jsonData = JSON.parse(text);
+    req.timings.mark("parse");
 
     // First filter by date if provided
     let filteredRepos = jsonData.repositories;
@@ -134,6 +182,7 @@ app.get("/api/json", async (req, res) => {
       filteredRepos = filteredRepos.filter((repo) => !repo.is_archived);
     }
     // If archived is not specified, use all repos (for total view)
+    req.timings.mark("transform");
 
     // Calculate statistics
     const stats = {
@@ -179,6 +228,8 @@ app.get("/api/json", async (req, res) => {
       };
     });
 
+    req.timings.mark("aggregate");
+
     res.json({
       stats,
       language_statistics: languageStats,
@@ -188,6 +239,7 @@ app.get("/api/json", async (req, res) => {
         filter_date: datetime && !isNaN(Date.parse(datetime)) ? datetime : null,
       },
     });
+    req.timings.mark("serialize");
   } catch (error) {
     console.error("Error fetching JSON:", error);
     res.status(500).json({ error: error.message });
@@ -206,8 +258,9 @@ app.get("/api/json", async (req, res) => {
  * @returns {string} response.message - Success confirmation message
  * @throws {Error} 400 - If entries data is invalid
  * @throws {Error} 500 - If update operation fails
+ * @throws {Error} 503 - If the server is busy, with a Retry-After header
  */
-app.post("/review/api/tech-radar/update", async (req, res) => {
+app.post("/review/api/tech-radar/update", updateLimiter, async (req, res) => {
   try {
     const { entries } = req.body;
 
@@ -338,8 +391,9 @@ app.post("/review/api/tech-radar/update", async (req, res) => {
  * @returns {Object} response.metadata - Last updated timestamp and repository request details
  * @throws {Error} 400 - If no repositories are specified
  * @throws {Error} 500 - If repository data fetching fails
+ * @throws {Error} 503 - If the server is busy, with a Retry-After header
  */
-app.get("/api/repository/project/json", async (req, res) => {
+app.get("/api/repository/project/json", repositoryLimiter, async (req, res) => {
   try {
     const { repositories, datetime, archived } = req.query;
     if (!repositories) {
@@ -356,7 +410,11 @@ app.get("/api/repository/project/json", async (req, res) => {
 
     const signedUrl = await getSignedUrl(s3Client, command, { expiresIn: 300 });
     const response = await fetch(signedUrl);
-    const jsonData = await response.json();
+    // Read the body before marking, as fetch resolves once headers arrive
+    const text = await response.text();
+    req.timings.mark("s3_fetch");
+    const jsonData = JSON.parse(text);
+    req.timings.mark("parse");
 
     // Filter repositories based on provided names
     let filteredRepos = jsonData.repositories.filter((repo) =>
@@ -379,6 +437,7 @@ app.get("/api/repository/project/json", async (req, res) => {
     } else if (archived === "false") {
       filteredRepos = filteredRepos.filter((repo) => !repo.is_archived);
     }
+    req.timings.mark("transform");
 
     // Calculate statistics from filtered repository data
     const stats = {
@@ -423,6 +482,8 @@ app.get("/api/repository/project/json", async (req, res) => {
       };
     });
 
+    req.timings.mark("aggregate");
+
     res.json({
       repositories: filteredRepos,
       stats,
@@ -436,6 +497,7 @@ app.get("/api/repository/project/json", async (req, res) => {
         filter_archived: archived,
       },
     });
+    req.timings.mark("serialize");
   } catch (error) {
     console.error("Error fetching repository data:", error);
     res.status(500).json({ error: error.message });
@@ -451,6 +513,7 @@ app.get("/api/repository/project/json", async (req, res) => {
  * @returns {number} response.uptime - Server uptime in seconds
  * @returns {Object} response.memory - Memory usage statistics
  * @returns {number} response.pid - Process ID
+ * @returns {Object} response.admission - Event loop delay and admission control state per route
  */
 app.get("/api/health", (req, res) => {
   logger.info("Health check endpoint called", {
@@ -471,6 +534,7 @@ app.get("/api/health", (req, res) => {
     uptime: process.uptime(),
     memory: process.memoryUsage(),
     pid: process.pid,
+    admission: getAdmissionStats(),
   };
 
   logger.debug("Health check details", healthResponse);
@@ -478,6 +542,79 @@ app.get("/api/health", (req, res) => {
   res.status(200).json(healthResponse);
 });
 
+/**
+ * Diagnostics endpoint for fetching per-stage timings of recent slow requests.
+ * Requires the DIAGNOSTICS_TOKEN bearer token; returns 404 if no token is configured.
+ * @route GET /api/diagnostics/slow-requests
+ * @returns {Object} Recent slow requests
+ * @returns {Object[]} response.requests - Slow requests, most recent first, with stage timings in milliseconds
+ * @throws {Error} 401 - If the token is missing or invalid
+ */
+app.get("/api/diagnostics/slow-requests", requireDiagnosticsToken, (req, res) => {
+  res.set("Cache-Control", "no-store");
+  res.json({ requests: getSlowRequests() });
+});
+
+/**
+ * Diagnostics endpoint for recording a CPU profile.
+ * Requires the DIAGNOSTICS_TOKEN bearer token; returns 404 if no token is configured.
+ * @route POST /api/diagnostics/cpu-profile
+ * @param {number} [seconds=10] - Profile duration in seconds, capped at 60
+ * @returns {Object} The CPU profile in .cpuprofile format, loadable in Chrome DevTools
+ * @throws {Error} 401 - If the token is missing or invalid
+ * @throws {Error} 409 - If another capture is already running
+ * @throws {Error} 500 - If profiling fails
+ */
+app.post("/api/diagnostics/cpu-profile", requireDiagnosticsToken, async (req, res) => {
+  try {
+    const seconds = parseInt(req.query.seconds, 10) || 10;
+    const profile = await captureCpuProfile(seconds);
+
+    res.set({
+      "Cache-Control": "no-store",
+      "Content-Disposition": `attachment; filename="backend-${Date.now()}.cpuprofile"`,
+    });
+    res.json(profile);
+  } catch (error) {
+    logger.error("Error capturing CPU profile:", { error: error.message });
+    res.status(error.status || 500).json({ error: error.message });
+  }
+});
+
+/**
+ * Diagnostics endpoint for taking a heap snapshot.
+ * The snapshot is written to a temporary file, streamed back and then deleted.
+ * The event loop is blocked while the snapshot is taken.
+ * Requires the DIAGNOSTICS_TOKEN bearer token; returns 404 if no token is configured.
+ * @route POST /api/diagnostics/heap-snapshot
+ * @returns {Object} The heap snapshot in .heapsnapshot format, loadable in Chrome DevTools
+ * @throws {Error} 401 - If the token is missing or invalid
+ * @throws {Error} 409 - If another capture is already running
+ * @throws {Error} 503 - If memory usage is too high to take a snapshot safely
+ * @throws {Error} 500 - If the snapshot fails
+ */
+app.post("/api/diagnostics/heap-snapshot", requireDiagnosticsToken, async (req, res) => {
+  try {
+    await captureHeapSnapshot(
+      (snapshotPath) =>
+        new Promise((resolve) => {
+          res.set("Cache-Control", "no-store");
+          res.download(snapshotPath, `backend-${Date.now()}.heapsnapshot`, (error) => {
+            if (error) {
+              logger.error("Error sending heap snapshot:", { error: error.message });
+            }
+            resolve();
+          });
+        })
+    );
+  } catch (error) {
+    logger.error("Error taking heap snapshot:", { error: error.message });
+    if (!res.headersSent) {
+      res.status(error.status || 500).json({ error: error.message });
+    }
+  }
+});
+
 // Add error handling
 process.on("uncaughtException", (error) => {
   logger.error("Uncaught Exception:", { error });
@@ -0,0 +1,186 @@
+/**
+ * @file Admission control for the data endpoints.
+ * Each limited route gets a concurrency limit and a bounded wait queue. When
+ * the queue is full, or a request waits too long, it is rejected with a 503 and
+ * a Retry-After header rather than piling up behind other requests. Limits shrink
+ * while the event loop is lagging and recover once it is healthy again, so
+ * unlimited routes such as /api/health stay responsive under load.
+ */
+const { monitorEventLoopDelay } = require("perf_hooks");
+const logger = require("../config/logger");
+
+/**
+ * Reads an integer environment variable, allowing 0 (e.g. ADMISSION_MAX_QUEUE=0 disables queueing).
+ * @param {string} name - Environment variable name
+ * @param {number} fallback - Value used when the variable is unset or invalid
+ * @returns {number} The parsed value
+ */
+const envInt = (name, fallback) => {
+  const value = parseInt(process.env[name], 10);
+  return Number.isNaN(value) || value < 0 ? fallback : value;
+};
+
+const defaultMaxConcurrent = Math.max(1, envInt("ADMISSION_MAX_CONCURRENT", 4));
+const defaultMaxQueue = envInt("ADMISSION_MAX_QUEUE", 20);
+const defaultQueueTimeoutMs = envInt("ADMISSION_QUEUE_TIMEOUT_MS", 10000);
+const maxEventLoopDelayMs = envInt("ADMISSION_MAX_EVENT_LOOP_DELAY_MS", 200);
+const sampleIntervalMs = 1000;
+
+const limiters = new Map();
+let loopDelayMonitor = null;
+let eventLoopDelayMs = 0;
+
+/**
+ * Samples the event loop delay and adjusts every limiter.
+ * Limits are halved while the p99 delay is above ADMISSION_MAX_EVENT_LOOP_DELAY_MS
+ * and raised by one per sample while it is below half of it.
+ */
+const sampleEventLoopDelay = () => {
+  eventLoopDelayMs = loopDelayMonitor.percentile(99) / 1e6;
+  loopDelayMonitor.reset();
+
+  limiters.forEach((limiter) => {
+    if (eventLoopDelayMs > maxEventLoopDelayMs) {
+      limiter.setLimit(Math.max(1, Math.floor(limiter.limit / 2)));
+    } else if (eventLoopDelayMs < maxEventLoopDelayMs / 2) {
+      limiter.setLimit(Math.min(limiter.maxConcurrent, limiter.limit + 1));
+    }
+  });
+};
+
+/**
+ * Starts the shared event loop delay monitor if it is not already running.
+ */
+const startEventLoopMonitor = () => {
+  if (loopDelayMonitor) return;
+
+  loopDelayMonitor = monitorEventLoopDelay({ resolution: 20 });
+  loopDelayMonitor.enable();
+  setInterval(sampleEventLoopDelay, sampleIntervalMs).unref();
+};
+
+/**
+ * Creates admission control middleware for a route.
+ * @param {string} name - Route name used in stats and logs
+ * @param {Object} [options] - Limiter options
+ * @param {number} [options.maxConcurrent] - Requests handled at once, defaults to ADMISSION_MAX_CONCURRENT
+ * @param {number} [options.maxQueue] - Requests allowed to wait, defaults to ADMISSION_MAX_QUEUE
+ * @param {number} [options.queueTimeoutMs] - How long a request may wait, defaults to ADMISSION_QUEUE_TIMEOUT_MS
+ * @returns {Function} Express middleware
+ */
+const createAdmissionLimiter = (
+  name,
+  {
+    maxConcurrent = defaultMaxConcurrent,
+    maxQueue = defaultMaxQueue,
+    queueTimeoutMs = defaultQueueTimeoutMs,
+  } = {}
+) => {
+  const retryAfterSeconds = String(Math.max(1, Math.ceil(queueTimeoutMs / 1000)));
+  const queue = [];
+  let active = 0;
+  let rejected = 0;
+
+  const state = {
+    maxConcurrent,
+    limit: maxConcurrent,
+    setLimit: (limit) => {
+      if (limit !== state.limit) {
+        logger.info("Admission limit changed", {
+          route: name,
+          limit,
+          event_loop_delay_ms: +eventLoopDelayMs.toFixed(1),
+        });
+      }
+      state.limit = limit;
+      drain();
+    },
+    stats: () => ({
+      active,
+      queued: queue.length,
+      limit: state.limit,
+      max_concurrent: maxConcurrent,
+      max_queue: maxQueue,
+      rejected,
+    }),
+  };
+
+  const reject = (res, reason) => {
+    rejected++;
+    logger.debug("Request rejected by admission control", { route: name, reason });
+    res.set("Retry-After", retryAfterSeconds);
+    res.status(503).json({ error: "Server is busy, please retry later" });
+  };
+
+  const admit = (req, res, next) => {
+    // Record time spent waiting for admission so it is not blamed on the next stage
+    req.timings?.mark("queue");
+    active++;
+    let released = false;
+    const release = () => {
+      if (released) return;
+      released = true;
+      active--;
+      drain();
+    };
+    res.on("finish", release);
+    res.on("close", release);
+    next();
+  };
+
+  const drain = () => {
+    while (active < state.limit && queue.length > 0) {
+      const { req, res, next, timer } = queue.shift();
+      clearTimeout(timer);
+      // Skip requests whose client has already disconnected
+      if (res.destroyed) continue;
+      admit(req, res, next);
+    }
+  };
+
+  limiters.set(name, state);
+  startEventLoopMonitor();
+
+  return (req, res, next) => {
+    if (active < state.limit) {
+      return admit(req, res, next);
+    }
+
+    if (queue.length >= maxQueue) {
+      return reject(res, "queue full");
+    }
+
+    const entry = { req, res, next };
+    entry.timer = setTimeout(() => {
+      const index = queue.indexOf(entry);
+      if (index === -1) return;
+      queue.splice(index, 1);
+      reject(res, "queue timeout");
+    }, queueTimeoutMs);
+    queue.push(entry);
+
+    // Free the queue slot if the client disconnects while waiting
+    res.on("close", () => {
+      const index = queue.indexOf(entry);
+      if (index === -1) return;
+      queue.splice(index, 1);
+      clearTimeout(entry.timer);
+    });
+  };
+};
+
+/**
+ * Returns the current event loop delay and the state of each limiter.
+ * @returns {Object} Admission control stats
+ */
+const getAdmissionStats = () => ({
+  event_loop_delay_ms: +eventLoopDelayMs.toFixed(1),
+  routes: Object.fromEntries(
+    Array.from(limiters, ([name, limiter]) => [name, limiter.stats()])
+  ),
+});
+
+module.exports = {
+  createAdmissionLimiter,
+  getAdmissionStats,
+};
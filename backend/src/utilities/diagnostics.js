@@ -0,0 +1,221 @@
+/**
+ * @file Diagnostics for investigating latency in production.
+ * Provides per-stage request timings kept in a ring buffer of recent slow
+ * requests, on-demand CPU profiles via the inspector and heap snapshots.
+ * The inspector session only exists while a profile is running, so nothing
+ * is profiled while idle.
+ */
+const crypto = require("crypto");
+const fs = require("fs");
+const inspector = require("inspector");
+const os = require("os");
+const path = require("path");
+const v8 = require("v8");
+const logger = require("../config/logger");
+
+const slowRequestThresholdMs = parseInt(process.env.SLOW_REQUEST_MS, 10) || 1000;
+const slowRequestBufferSize = 50;
+const maxProfileSeconds = 60;
+// Heap snapshots are refused once RSS is above this fraction of the memory limit,
+// as taking one needs roughly as much memory again as the heap it describes
+const heapSnapshotMaxMemoryFraction = 0.5;
+
+const slowRequests = new Array(slowRequestBufferSize);
+let slowRequestIndex = 0;
+let captureInProgress = false;
+
+/**
+ * Middleware that attaches a stage timer to the request as req.timings.
+ * Handlers call req.timings.mark(name) at the end of each stage to record the
+ * time since the previous mark; once the response finishes, requests slower
+ * than SLOW_REQUEST_MS are recorded with their stage breakdown.
+ * @param {Object} req - Express request
+ * @param {Object} res - Express response
+ * @param {Function} next - Express next callback
+ */
+const requestTimings = (req, res, next) => {
+  const start = process.hrtime.bigint();
+  const stages = {};
+  let lastMark = start;
+
+  req.timings = {
+    /**
+     * Ends a stage, recording the time since the previous mark. Repeated stages are summed.
+     * @param {string} name - Stage name (e.g. queue, s3_fetch, parse, transform, aggregate, serialize)
+     */
+    mark: (name) => {
+      const now = process.hrtime.bigint();
+      stages[name] = (stages[name] || 0) + Number(now - lastMark) / 1e6;
+      lastMark = now;
+    },
+  };
+
+  res.on("finish", () => {
+    const durationMs = Number(process.hrtime.bigint() - start) / 1e6;
+    if (durationMs < slowRequestThresholdMs) return;
+
+    slowRequests[slowRequestIndex] = {
+      method: req.method,
+      path: req.originalUrl,
+      status: res.statusCode,
+      timestamp: new Date().toISOString(),
+      duration_ms: +durationMs.toFixed(3),
+      stages_ms: Object.fromEntries(
+        Object.entries(stages).map(([name, ms]) => [name, +ms.toFixed(3)])
+      ),
+    };
+    slowRequestIndex = (slowRequestIndex + 1) % slowRequestBufferSize;
+  });
+
+  next();
+};
+
+/**
+ * Returns the recorded slow requests, most recent first.
+ * @returns {Object[]} Slow request records
+ */
+const getSlowRequests = () => {
+  const records = [];
+  for (let i = 1; i <= slowRequestBufferSize; i++) {
+    const index =
+      (slowRequestIndex - i + slowRequestBufferSize) % slowRequestBufferSize;
+    if (slowRequests[index]) records.push(slowRequests[index]);
+  }
+  return records;
+};
+
+/**
+ * Middleware that only allows requests carrying the DIAGNOSTICS_TOKEN bearer token.
+ * Responds 404 when no token is configured so the routes are invisible by default.
+ * @param {Object} req - Express request
+ * @param {Object} res - Express response
+ * @param {Function} next - Express next callback
+ */
+const requireDiagnosticsToken = (req, res, next) => {
+  const token = process.env.DIAGNOSTICS_TOKEN;
+  if (!token) {
+    return res.status(404).json({ error: "Not found" });
+  }
+
+  const provided = Buffer.from(req.get("Authorization") || "");
+  const expected = Buffer.from(`Bearer ${token}`);
+  if (
+    provided.length !== expected.length ||
+    !crypto.timingSafeEqual(provided, expected)
+  ) {
+    return res.status(401).json({ error: "Unauthorized" });
+  }
+
+  next();
+};
+
+/**
+ * Sends a command on an inspector session.
+ * @param {inspector.Session} session - Connected inspector session
+ * @param {string} method - Inspector protocol method
+ * @param {Object} [params] - Method parameters
+ * @returns {Promise<Object>} The command result
+ */
+const post = (session, method, params = {}) =>
+  new Promise((resolve, reject) => {
+    session.post(method, params, (error, result) =>
+      error ? reject(error) : resolve(result)
+    );
+  });
+
+/**
+ * Runs a capture, allowing one capture at a time.
+ * @param {Function} capture - The capture to run
+ * @returns {Promise<*>} The result of capture
+ * @throws {Error} 409 - If another capture is already running
+ */
+const withCaptureLock = async (capture) => {
+  if (captureInProgress) {
+    const error = new Error("A capture is already in progress");
+    error.status = 409;
+    throw error;
+  }
+
+  captureInProgress = true;
+  try {
+    return await capture();
+  } finally {
+    captureInProgress = false;
+  }
+};
+
+/**
+ * Records a CPU profile for the given number of seconds.
+ * @param {number} seconds - Profile duration, capped at 60 seconds
+ * @returns {Promise<Object>} The profile in .cpuprofile format
+ */
+const captureCpuProfile = (seconds) =>
+  withCaptureLock(async () => {
+    const durationMs = Math.min(Math.max(seconds, 1), maxProfileSeconds) * 1000;
+    logger.info("Starting CPU profile", { duration_ms: durationMs });
+
+    const session = new inspector.Session();
+    session.connect();
+    try {
+      await post(session, "Profiler.enable");
+      await post(session, "Profiler.start");
+      await new Promise((resolve) => setTimeout(resolve, durationMs));
+      const { profile } = await post(session, "Profiler.stop");
+      await post(session, "Profiler.disable");
+
+      logger.info("CPU profile complete", { duration_ms: durationMs });
+      return profile;
+    } finally {
+      session.disconnect();
+    }
+  });
+
+/**
+ * Takes a heap snapshot, writing it to a temporary file that is deleted once sent.
+ * This blocks the event loop while the heap is walked, and is refused when
+ * there is not enough memory headroom to take it safely.
+ * @param {Function} send - Receives the snapshot file path and returns a promise that resolves once it has been sent
+ * @returns {Promise<void>}
+ * @throws {Error} 409 - If another capture is already running
+ * @throws {Error} 503 - If memory usage is too high to take a snapshot
+ */
+const captureHeapSnapshot = (send) =>
+  withCaptureLock(async () => {
+    // constrainedMemory reports the container limit, or a huge value when unconstrained
+    const memoryLimit = Math.min(
+      process.constrainedMemory?.() || Infinity,
+      os.totalmem()
+    );
+    const { rss } = process.memoryUsage();
+    if (rss > memoryLimit * heapSnapshotMaxMemoryFraction) {
+      const error = new Error(
+        "Memory usage is too high to take a heap snapshot safely"
+      );
+      error.status = 503;
+      throw error;
+    }
+
+    logger.info("Taking heap snapshot", { rss, memory_limit: memoryLimit });
+    const snapshotPath = v8.writeHeapSnapshot(
+      path.join(os.tmpdir(), `backend-${process.pid}-${Date.now()}.heapsnapshot`)
+    );
+    logger.info("Heap snapshot complete", {
+      size: fs.statSync(snapshotPath).size,
+    });
+
+    try {
+      await send(snapshotPath);
+    } finally {
+      fs.promises.unlink(snapshotPath).catch((error) => {
+        logger.error("Error deleting heap snapshot:", { error: error.message });
+      });
+    }
+  });
+
+module.exports = {
+  requestTimings,
+  getSlowRequests,
+  requireDiagnosticsToken,
+  captureCpuProfile,
+  captureHeapSnapshot,
+};
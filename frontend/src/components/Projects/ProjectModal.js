@@ -28,6 +28,9 @@ const ProjectModal = ({
   const [isLoading, setIsLoading] = useState(false);
 
   useEffect(() => {
+    // Ignore background updates once the modal has closed or shows another project
+    let isCurrent = true;
+
     const fetchRepoInfo = async () => {
       if (isOpen && project?.Repo) {
         setIsLoading(true);
@@ -41,7 +44,13 @@ const ProjectModal = ({
           .filter(Boolean);
 
         if (projectRepos.length > 0) {
-          const data = await fetchRepositoryData(projectRepos);
+          const data = await fetchRepositoryData(projectRepos, null, null, {
+            onUpdate: (updated) => {
+              if (isCurrent && updated?.repositories) {
+                setRepoData(updated.repositories);
+              }
+            },
+          });
           if (data?.repositories) {
             setRepoData(data.repositories);
           }
@@ -53,6 +62,10 @@ const ProjectModal = ({
     };
 
     fetchRepoInfo();
+
+    return () => {
+      isCurrent = false;
+    };
   }, [isOpen, project]);
 
   if (!isOpen || !project) return null;
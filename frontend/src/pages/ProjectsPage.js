@@ -25,7 +25,7 @@ function ProjectsPage() {
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const data = await fetchCSVFromS3();
+        const data = await fetchCSVFromS3({ onUpdate: setProjectsData });
         setProjectsData(data);
       } catch (error) {
         console.error(error);
@@ -35,7 +35,7 @@ function ProjectsPage() {
 
     const fetchRadarData = async () => {
       try {
-        const data = await fetchTechRadarJSONFromS3();
+        const data = await fetchTechRadarJSONFromS3({ onUpdate: setRadarData });
         setRadarData(data);
       } catch (error) {
         console.error("Failed to load radar data:", error);
@@ -78,7 +78,7 @@ function ProjectsPage() {
    */
   const handleRefresh = async () => {
     try {
-      const newData = await fetchCSVFromS3();
+      const newData = await fetchCSVFromS3({ forceRefresh: true });
       setProjectsData(newData);
       toast.success("Data refreshed successfully.");
     } catch (error) {
@@ -64,8 +64,9 @@ function RadarPage() {
    * useEffect hook to fetch the tech radar data from S3.
    */
   useEffect(() => {
-    fetchTechRadarJSONFromS3().then((data) => setData(data));
-    fetchTechRadarJSONFromS3().then((data) => setData(data));
+    fetchTechRadarJSONFromS3({ onUpdate: setData }).then((data) =>
+      setData(data)
+    );
   }, []);
 
   /**
@@ -73,7 +74,7 @@ function RadarPage() {
    */
   useEffect(() => {
     const fetchData = async () => {
-      const data = await fetchCSVFromS3();
+      const data = await fetchCSVFromS3({ onUpdate: setProjectsData });
       setProjectsData(data);
     };
 
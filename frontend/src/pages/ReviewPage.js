@@ -1,6 +1,7 @@
 import React, { useState, useEffect } from "react";
 import { fetchTechRadarJSONFromS3 } from "../utilities/getTechRadarJson";
 import { fetchCSVFromS3 } from "../utilities/getCSVData";
+import { invalidateCache } from "../utilities/dataCache";
 import Header from "../components/Header/Header";
 import { ThemeProvider } from "../contexts/ThemeContext";
 import "../styles/ReviewPage.css";
@@ -66,8 +67,9 @@ const ReviewPage = () => {
     const fetchAllData = async () => {
       try {
         setIsLoading(true);
+        // Always start from the latest radar so edits are not made against a stale copy
         const [radarData, csvData] = await Promise.all([
-          fetchTechRadarJSONFromS3(),
+          fetchTechRadarJSONFromS3({ forceRefresh: true }),
           fetchCSVFromS3(),
         ]);
 
@@ -319,6 +321,7 @@ const ReviewPage = () => {
         throw new Error("Failed to save changes");
       }
 
+      await invalidateCache("/api/tech-radar/json");
       toast.success("Changes saved successfully!");
     } catch (error) {
       console.error("Error saving changes:", error);
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from "react";
+import React, { useState, useEffect, useRef } from "react";
 import { useNavigate } from "react-router-dom";
 import Statistics from "../components/Statistics/Statistics";
 import Header from "../components/Header/Header";
@@ -25,11 +25,13 @@ function StatisticsPage() {
   const [currentRepoView, setCurrentRepoView] = useState('unarchived');
   const [searchTerm, setSearchTerm] = useState('');
   const [radarData, setRadarData] = useState(null);
+  // Identifies the latest fetchStatistics call so late background updates for old filters are ignored
+  const latestStatsRequest = useRef(0);
 
   useEffect(() => {
     const fetchProjects = async () => {
       try {
-        const data = await fetchCSVFromS3();
+        const data = await fetchCSVFromS3({ onUpdate: setProjectsData });
         setProjectsData(data);
       } catch (error) {
         toast.error("Error fetching projects.");
@@ -38,7 +40,7 @@ function StatisticsPage() {
 
     const fetchRadarData = async () => {
       try {
-        const data = await fetchTechRadarJSONFromS3();
+        const data = await fetchTechRadarJSONFromS3({ onUpdate: setRadarData });
         setRadarData(data);
       } catch (error) {
         console.error('Failed to load radar data:', error);
@@ -49,6 +51,65 @@ function StatisticsPage() {
     fetchRadarData();
   }, []);
 
+  /**
+   * mapStatistics function to map a statistics response to the shape used by the Statistics component.
+   *
+   * @param {Object} statsData - The statistics response.
+   * @param {Object} radarData - The tech radar data.
+   * @param {string} repoView - The repository view the statistics are for.
+   * @returns {Object} - The mapped statistics.
+   */
+  const mapStatistics = (statsData, radarData, repoView) => {
+    return {
+      stats_unarchived:
+        repoView === "unarchived"
+          ? {
+              total: statsData.stats?.total_repos || 0,
+              private: statsData.stats?.total_private_repos || 0,
+              public: statsData.stats?.total_public_repos || 0,
+              internal: statsData.stats?.total_internal_repos || 0,
+              active_last_month: 0,
+              active_last_3months: 0,
+              active_last_6months: 0,
+            }
+          : {},
+      stats_archived:
+        repoView === "archived"
+          ? {
+              total: statsData.stats?.total_repos || 0,
+              private: statsData.stats?.total_private_repos || 0,
+              public: statsData.stats?.total_public_repos || 0,
+              internal: statsData.stats?.total_internal_repos || 0,
+              active_last_month: 0,
+              active_last_3months: 0,
+              active_last_6months: 0,
+            }
+          : {},
+      stats:
+        repoView === "total"
+          ? {
+              total: statsData.stats?.total_repos || 0,
+              private: statsData.stats?.total_private_repos || 0,
+              public: statsData.stats?.total_public_repos || 0,
+              internal: statsData.stats?.total_internal_repos || 0,
+              active_last_month: 0,
+              active_last_3months: 0,
+              active_last_6months: 0,
+            }
+          : null,
+      language_statistics_unarchived:
+        repoView === "unarchived" ? statsData.language_statistics || {} : {},
+      language_statistics_archived:
+        repoView === "archived" ? statsData.language_statistics || {} : {},
+      language_statistics:
+        repoView === "total" ? statsData.language_statistics || {} : {},
+      radar_entries: radarData.entries,
+      metadata: statsData.metadata || {
+        last_updated: new Date().toISOString(),
+      },
+    };
+  };
+
   /**
    * fetchStatistics function to fetch the statistics data.
    *
@@ -57,6 +118,7 @@ function StatisticsPage() {
    */
   const fetchStatistics = async (date = null, repoView = "unarchived") => {
     setIsLoading(true);
+    const requestId = ++latestStatsRequest.current;
     try {
       const baseUrl =
         process.env.NODE_ENV === "development"
@@ -82,10 +144,28 @@ function StatisticsPage() {
             : repoView === "unarchived"
               ? "false"
               : null;
+        const toStatsData = (repoData) => ({
+          stats: repoData.stats,
+          language_statistics: repoData.language_statistics,
+          metadata: repoData.metadata,
+        });
         const repoResponse = await fetchRepositoryData(
           repoNames,
           date,
-          archived
+          archived,
+          {
+            onUpdate: (repoData) => {
+              if (
+                repoData?.repositories &&
+                radarResponse &&
+                requestId === latestStatsRequest.current
+              ) {
+                setStatsData(
+                  mapStatistics(toStatsData(repoData), radarResponse, repoView)
+                );
+              }
+            },
+          }
         );
 
         if (!repoResponse?.repositories) {
@@ -94,12 +174,7 @@ function StatisticsPage() {
 
         statsResponse = {
           ok: true,
-          json: () =>
-            Promise.resolve({
-              stats: repoResponse.stats,
-              language_statistics: repoResponse.language_statistics,
-              metadata: repoResponse.metadata,
-            }),
+          json: () => Promise.resolve(toStatsData(repoResponse)),
         };
       } else {
         // Fetch general statistics
@@ -132,56 +207,7 @@ function StatisticsPage() {
         throw new Error("Invalid response format");
       }
 
-      const mappedStats = {
-        stats_unarchived:
-          repoView === "unarchived"
-            ? {
-                total: statsData.stats?.total_repos || 0,
-                private: statsData.stats?.total_private_repos || 0,
-                public: statsData.stats?.total_public_repos || 0,
-                internal: statsData.stats?.total_internal_repos || 0,
-                active_last_month: 0,
-                active_last_3months: 0,
-                active_last_6months: 0,
-              }
-            : {},
-        stats_archived:
-          repoView === "archived"
-            ? {
-                total: statsData.stats?.total_repos || 0,
-                private: statsData.stats?.total_private_repos || 0,
-                public: statsData.stats?.total_public_repos || 0,
-                internal: statsData.stats?.total_internal_repos || 0,
-                active_last_month: 0,
-                active_last_3months: 0,
-                active_last_6months: 0,
-              }
-            : {},
-        stats:
-          repoView === "total"
-            ? {
-                total: statsData.stats?.total_repos || 0,
-                private: statsData.stats?.total_private_repos || 0,
-                public: statsData.stats?.total_public_repos || 0,
-                internal: statsData.stats?.total_internal_repos || 0,
-                active_last_month: 0,
-                active_last_3months: 0,
-                active_last_6months: 0,
-              }
-            : null,
-        language_statistics_unarchived:
-          repoView === "unarchived" ? statsData.language_statistics || {} : {},
-        language_statistics_archived:
-          repoView === "archived" ? statsData.language_statistics || {} : {},
-        language_statistics:
-          repoView === "total" ? statsData.language_statistics || {} : {},
-        radar_entries: radarData.entries,
-        metadata: statsData.metadata || {
-          last_updated: new Date().toISOString(),
-        },
-      };
-
-      setStatsData(mappedStats);
+      setStatsData(mapStatistics(statsData, radarData, repoView));
     } catch (error) {
       console.error('Error fetching statistics:', error);
       toast.error('Failed to load statistics.');
@@ -0,0 +1,240 @@
+/**
+ * @file Shared client-side cache for the data fetching utilities.
+ *
+ * Responses are kept in memory and persisted to IndexedDB so repeat page loads
+ * can render straight away. Cached entries are served stale-while-revalidate:
+ * once an entry is older than its max age it is returned immediately while a
+ * conditional (If-None-Match) request checks for newer data in the background.
+ * Concurrent requests for the same URL share a single network request.
+ */
+
+const DB_NAME = "tech-radar-cache";
+const DB_VERSION = 1;
+const STORE_NAME = "responses";
+
+// How long an entry is served without revalidating, in milliseconds.
+const DEFAULT_MAX_AGE = 30 * 1000;
+// How long an entry is kept in IndexedDB after it was last validated, in milliseconds.
+const PERSISTED_MAX_AGE = 7 * 24 * 60 * 60 * 1000;
+
+const memoryCache = new Map();
+const inFlightRequests = new Map();
+let dbPromise = null;
+
+/**
+ * purgeExpiredEntries function to delete persisted entries that have not been
+ * validated within PERSISTED_MAX_AGE, so lookups such as one-off repository
+ * lists do not accumulate forever.
+ *
+ * @param {IDBDatabase} db - The database connection.
+ */
+const purgeExpiredEntries = (db) => {
+  try {
+    const cutoff = Date.now() - PERSISTED_MAX_AGE;
+    const transaction = db.transaction(STORE_NAME, "readwrite");
+    const request = transaction.objectStore(STORE_NAME).openCursor();
+    request.onsuccess = () => {
+      const cursor = request.result;
+      if (!cursor) return;
+      if (!(cursor.value.storedAt >= cutoff)) cursor.delete();
+      cursor.continue();
+    };
+  } catch (error) {
+    console.error("Failed to purge expired cache entries:", error);
+  }
+};
+
+/**
+ * openDatabase function to lazily open the IndexedDB database.
+ * Expired entries are purged each time the database is opened.
+ * Resolves to null when IndexedDB is unavailable so the cache falls back to memory only.
+ *
+ * @returns {Promise<IDBDatabase|null>} - The database connection.
+ */
+const openDatabase = () => {
+  if (dbPromise) return dbPromise;
+
+  dbPromise = new Promise((resolve) => {
+    if (typeof indexedDB === "undefined") {
+      resolve(null);
+      return;
+    }
+
+    try {
+      const request = indexedDB.open(DB_NAME, DB_VERSION);
+      request.onupgradeneeded = () => {
+        request.result.createObjectStore(STORE_NAME, { keyPath: "key" });
+      };
+      request.onsuccess = () => {
+        purgeExpiredEntries(request.result);
+        resolve(request.result);
+      };
+      request.onerror = () => resolve(null);
+      request.onblocked = () => resolve(null);
+    } catch (error) {
+      resolve(null);
+    }
+  });
+
+  return dbPromise;
+};
+
+/**
+ * runTransaction function to run a single request against the object store.
+ *
+ * @param {IDBTransactionMode} mode - The transaction mode.
+ * @param {Function} operation - Receives the object store and returns an IDBRequest.
+ * @returns {Promise<any>} - The request result, or null if the database is unavailable.
+ */
+const runTransaction = async (mode, operation) => {
+  const db = await openDatabase();
+  if (!db) return null;
+
+  return new Promise((resolve) => {
+    try {
+      const transaction = db.transaction(STORE_NAME, mode);
+      const request = operation(transaction.objectStore(STORE_NAME));
+      request.onsuccess = () => resolve(request.result ?? null);
+      request.onerror = () => resolve(null);
+    } catch (error) {
+      resolve(null);
+    }
+  });
+};
+
+/**
+ * readEntry function to read a cache entry, checking memory before IndexedDB.
+ *
+ * @param {string} key - The cache key.
+ * @returns {Promise<Object|null>} - The cache entry.
+ */
+const readEntry = async (key) => {
+  if (memoryCache.has(key)) return memoryCache.get(key);
+
+  const entry = await runTransaction("readonly", (store) => store.get(key));
+  if (entry) memoryCache.set(key, entry);
+  return entry;
+};
+
+/**
+ * writeEntry function to store a cache entry in memory and IndexedDB.
+ *
+ * @param {Object} entry - The cache entry.
+ */
+const writeEntry = (entry) => {
+  memoryCache.set(entry.key, entry);
+  runTransaction("readwrite", (store) => store.put(entry));
+};
+
+/**
+ * revalidate function to fetch the latest data for a URL.
+ * Sends the cached ETag so an unchanged response comes back as a 304.
+ * Concurrent calls for the same URL share one request.
+ *
+ * @param {string} url - The URL to fetch.
+ * @param {Object|null} entry - The current cache entry, if any.
+ * @returns {Promise<{data: any, changed: boolean}>} - The latest data and whether it changed.
+ */
+const revalidate = (url, entry) => {
+  if (inFlightRequests.has(url)) return inFlightRequests.get(url);
+
+  const request = (async () => {
+    const headers = {};
+    if (entry?.etag) headers["If-None-Match"] = entry.etag;
+
+    const response = await fetch(url, { headers, cache: "no-store" });
+
+    if (response.status === 304 && entry) {
+      writeEntry({ ...entry, storedAt: Date.now() });
+      return { data: entry.data, changed: false };
+    }
+
+    if (!response.ok) {
+      const error = new Error(`Failed to fetch ${url}: ${response.statusText}`);
+      error.status = response.status;
+      throw error;
+    }
+
+    const data = await response.json();
+    writeEntry({
+      key: url,
+      data,
+      etag: response.headers.get("ETag"),
+      storedAt: Date.now(),
+    });
+    return { data, changed: true };
+  })();
+
+  inFlightRequests.set(url, request);
+  request.then(
+    () => inFlightRequests.delete(url),
+    () => inFlightRequests.delete(url)
+  );
+
+  return request;
+};
+
+/**
+ * fetchCachedJSON function to fetch JSON through the shared cache.
+ *
+ * Fresh entries are returned without a request. Stale entries are returned
+ * immediately and revalidated in the background, calling onUpdate if newer data
+ * arrives. Without a cached entry, or when forceRefresh is set, the request is awaited.
+ *
+ * @param {string} url - The URL to fetch.
+ * @param {Object} [options] - Cache options.
+ * @param {Function} [options.onUpdate] - Called with newer data found by background revalidation.
+ * @param {boolean} [options.forceRefresh] - Skip the cached copy and wait for the network.
+ * @param {number} [options.maxAge] - How long an entry is served without revalidating, in milliseconds.
+ * @returns {Promise<any>} - The response data.
+ * @throws {Error} - If the request fails and there is no cached copy to serve.
+ */
+export const fetchCachedJSON = async (
+  url,
+  { onUpdate, forceRefresh = false, maxAge = DEFAULT_MAX_AGE } = {}
+) => {
+  const entry = await readEntry(url);
+
+  if (!entry || forceRefresh) {
+    const { data } = await revalidate(url, entry);
+    return data;
+  }
+
+  if (Date.now() - entry.storedAt > maxAge) {
+    revalidate(url, entry)
+      .then(({ data, changed }) => {
+        if (changed && onUpdate) onUpdate(data);
+      })
+      .catch((error) => {
+        console.error("Background revalidation failed:", error);
+      });
+  }
+
+  return entry.data;
+};
+
+/**
+ * invalidateCache function to drop cached entries so the next fetch goes to the network.
+ *
+ * @param {string} [match] - Only drop entries whose URL contains this string. Drops everything if omitted.
+ * @returns {Promise<void>} - Resolves once the entries have been removed from IndexedDB.
+ */
+export const invalidateCache = async (match) => {
+  Array.from(memoryCache.keys())
+    .filter((key) => !match || key.includes(match))
+    .forEach((key) => memoryCache.delete(key));
+
+  if (!match) {
+    await runTransaction("readwrite", (store) => store.clear());
+    return;
+  }
+
+  const storedKeys = await runTransaction("readonly", (store) =>
+    store.getAllKeys()
+  );
+  await Promise.all(
+    (storedKeys || [])
+      .filter((key) => key.includes(match))
+      .map((key) => runTransaction("readwrite", (store) => store.delete(key)))
+  );
+};
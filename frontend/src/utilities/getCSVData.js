@@ -1,40 +1,56 @@
 import { toast } from "react-hot-toast";
+import { fetchCachedJSON } from "./dataCache";
+import Papa from "papaparse";
+
+/**
+ * parseCSVFromURL function to download and parse a CSV file.
+ * Papa Parse streams the download and parses it in a web worker so large files
+ * do not block the UI, falling back to the main thread where workers are unavailable.
+ *
+ * @param {string} path - The path of the CSV file.
+ * @returns {Promise<Object[]>} - The parsed rows, keyed by header.
+ */
+const parseCSVFromURL = (path) =>
+  new Promise((resolve, reject) => {
+    const rows = [];
+
+    // The worker runs from a blob URL, so relative paths must be made absolute
+    Papa.parse(new URL(path, window.location.origin).href, {
+      download: true,
+      worker: true,
+      header: true,
+      skipEmptyLines: true,
+      // Function options other than these callbacks cannot be posted to the
+      // worker, so headers are used as-is rather than through transformHeader
+      chunk: (results) => {
+        rows.push(...results.data);
+      },
+      complete: () => resolve(rows),
+      error: (error) => reject(error),
+    });
+  });
+
 /**
  * fetchCSVFromS3 function to fetch the CSV data from the S3 bucket.
+ * Served from the shared data cache when available.
  * Falls back to local CSV if S3 fetch fails.
  *
+ * @param {Object} [options] - Cache options passed to fetchCachedJSON.
+ * @param {Function} [options.onUpdate] - Called with newer data found by background revalidation.
+ * @param {boolean} [options.forceRefresh] - Skip the cached copy and wait for the network.
  * @returns {Promise<Object>} - The CSV data.
  */
-export const fetchCSVFromS3 = async () => {
+export const fetchCSVFromS3 = async (options = {}) => {
   try {
-    let response;
-    if (process.env.NODE_ENV === "development") {
-      response = await fetch(`http://localhost:5001/api/csv`);
-    } else {
-      response = await fetch("/api/csv");
-    }
-    if (!response.ok) {
-      throw new Error("Failed to fetch CSV data");
-    }
+    const url =
+      process.env.NODE_ENV === "development"
+        ? "http://localhost:5001/api/csv"
+        : "/api/csv";
 
-    const data = await response.json();
-    return data;
+    return await fetchCachedJSON(url, options);
   } catch (error) {
     try {
-      const response = await fetch("/tech_radar/onsTechData.csv");
-      if (!response.ok) {
-        throw new Error("Failed to fetch local CSV");
-      }
-      const csvText = await response.text();
-      const rows = csvText.split("\n");
-      const headers = rows[0].split(",");
-      const data = rows.slice(1).map((row) => {
-        const values = row.split(",");
-        return headers.reduce((obj, header, i) => {
-          obj[header] = values[i];
-          return obj;
-        }, {});
-      });
+      const data = await parseCSVFromURL("/tech_radar/onsTechData.csv");
       toast.error("Error loading project data, using local CSV.");
       return data;
     } catch (fallbackError) {
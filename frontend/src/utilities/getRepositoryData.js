@@ -1,17 +1,22 @@
 import { toast } from "react-hot-toast";
+import { fetchCachedJSON } from "./dataCache";
 
 /**
  * fetchRepositoryData function to fetch repository data for specific repositories.
+ * Served from the shared data cache when available.
  *
  * @param {string[]} repositories - Array of repository names to fetch data for.
  * @param {string} [date] - Optional ISO date string to filter repositories by last commit date.
  * @param {string} [archived] - Optional 'true'/'false' to filter archived repositories.
+ * @param {Object} [options] - Cache options passed to fetchCachedJSON.
+ * @param {Function} [options.onUpdate] - Called with newer data found by background revalidation.
  * @returns {Promise<Object>} - The repository data.
  */
 export const fetchRepositoryData = async (
   repositories,
   date = null,
-  archived = null
+  archived = null,
+  options = {}
 ) => {
   try {
     if (!repositories || repositories.length === 0) {
@@ -28,16 +33,7 @@ export const fetchRepositoryData = async (
         ? "http://localhost:5001/api/repository/project/json"
         : "/api/repository/project/json";
 
-    const response = await fetch(`${baseUrl}?${params.toString()}`);
-
-    if (!response.ok) {
-      throw new Error(
-        `Failed to fetch repository data: ${response.statusText}`
-      );
-    }
-
-    const data = await response.json();
-    return data;
+    return await fetchCachedJSON(`${baseUrl}?${params.toString()}`, options);
   } catch (error) {
     toast.error("Error loading repository data.");
     return null;
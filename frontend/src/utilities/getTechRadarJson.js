@@ -1,25 +1,28 @@
 import { toast } from "react-hot-toast";
+import { fetchCachedJSON } from "./dataCache";
 
 /**
  * fetchTechRadarJSONFromS3 function to fetch the tech radar data from S3.
+ * Served from the shared data cache when available.
  *
+ * @param {Object} [options] - Cache options passed to fetchCachedJSON.
+ * @param {Function} [options.onUpdate] - Called with newer data found by background revalidation.
+ * @param {boolean} [options.forceRefresh] - Skip the cached copy and wait for the network.
  * @returns {Promise<Object>} - The tech radar data.
  */
-export const fetchTechRadarJSONFromS3 = async () => {
+export const fetchTechRadarJSONFromS3 = async (options = {}) => {
   try {
-    let response;
-    if (process.env.NODE_ENV === "development") {
-      response = await fetch(`http://localhost:5001/api/tech-radar/json`);
-    } else {
-      response = await fetch("/api/tech-radar/json");
-    }
-    if (!response.ok) {
-      return null;
-    }
+    const url =
+      process.env.NODE_ENV === "development"
+        ? "http://localhost:5001/api/tech-radar/json"
+        : "/api/tech-radar/json";
 
-    const data = await response.json();
-    return data;
+    return await fetchCachedJSON(url, options);
   } catch (error) {
+    // Error responses from the API return null without a toast
+    if (error.status) {
+      return null;
+    }
     toast.error("Error loading tech data.");
     return null;
   }
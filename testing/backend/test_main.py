@@ -2,9 +2,12 @@
 This module contains the test cases for the backend API.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import requests
 import random
+import pytest
 
 BASE_URL = "http://localhost:5001"
 
@@ -26,6 +29,7 @@ def test_health_check():
             - Server uptime in seconds
             - Memory usage statistics
             - Process ID
+            - Admission control state
     """
     response = requests.get(f"{BASE_URL}/api/health", timeout=10)
     assert response.status_code == 200
@@ -35,6 +39,8 @@ def test_health_check():
     assert "uptime" in data
     assert "memory" in data
     assert "pid" in data
+    assert "event_loop_delay_ms" in data["admission"]
+    assert "routes" in data["admission"]
 
 def test_csv_endpoint():
     """Test the CSV data endpoint functionality.
@@ -737,3 +743,72 @@ def test_tech_radar_update_invalid_references():
     )
     assert response.status_code == 400
     assert "Invalid entry structure" in response.json()["error"]
+
+def test_diagnostics_requires_token():
+    """Test that the diagnostics endpoints require the bearer token.
+
+    This test verifies that the slow request timings endpoint accepts the
+    diagnostics bearer token and rejects a wrong or missing one. It needs the
+    same DIAGNOSTICS_TOKEN the backend was started with, and is skipped
+    otherwise.
+
+    Endpoint:
+        GET /api/diagnostics/slow-requests
+
+    Expects:
+        - 200 status code and a list of slow requests with the correct token
+        - 401 status code with an invalid token
+        - 401 status code without a token
+    """
+    token = os.environ.get("DIAGNOSTICS_TOKEN")
+    if not token:
+        pytest.skip("DIAGNOSTICS_TOKEN is not set")
+
+    url = f"{BASE_URL}/api/diagnostics/slow-requests"
+
+    response = requests.get(url, headers={"Authorization": f"Bearer {token}"}, timeout=10)
+    assert response.status_code == 200
+    assert isinstance(response.json()["requests"], list)
+
+    response = requests.get(url, headers={"Authorization": "Bearer invalid-token"}, timeout=10)
+    assert response.status_code == 401
+
+    response = requests.get(url, timeout=10)
+    assert response.status_code == 401
+
+def test_admission_control_rejects_when_saturated():
+    """Test that a saturated route is rejected while the health check stays available.
+
+    This test sends a burst of concurrent requests to a limited route and
+    verifies that requests beyond the concurrency limit are rejected with a
+    503 and a Retry-After header, while /api/health keeps responding. It needs
+    the backend started with ADMISSION_MAX_CONCURRENT=1 ADMISSION_MAX_QUEUE=0
+    against the S3 stand-in with added latency (see testing/README.md), and
+    is skipped unless ADMISSION_SATURATION_TEST is set.
+
+    Endpoints:
+        GET /api/json
+        GET /api/health
+
+    Expects:
+        - At least one 503 status code from the burst
+        - Retry-After header with a whole number of seconds on each 503
+        - JSON error message on each 503
+        - 200 status code from /api/health during the burst
+    """
+    if not os.environ.get("ADMISSION_SATURATION_TEST"):
+        pytest.skip("ADMISSION_SATURATION_TEST is not set")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        burst = [executor.submit(requests.get, f"{BASE_URL}/api/json", timeout=30) for _ in range(8)]
+        health = requests.get(f"{BASE_URL}/api/health", timeout=5)
+        responses = [future.result() for future in burst]
+
+    assert health.status_code == 200
+
+    rejected = [response for response in responses if response.status_code == 503]
+    assert len(rejected) > 0
+    for response in rejected:
+        assert response.headers["Retry-After"].isdigit()
+        assert response.json()["error"] == "Server is busy, please retry later"
+    assert all(response.status_code in [200, 503] for response in responses)
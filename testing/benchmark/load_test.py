@@ -0,0 +1,265 @@
+"""
+This module runs a concurrent load test against the backend API.
+
+It reports latency percentiles and status codes per endpoint, optionally
+probing /api/health alongside the load to check it stays responsive, and can trigger
+the backend diagnostics endpoints during the run, saving a CPU profile and/or
+heap snapshot and printing the stage timings of slow requests.
+
+Example:
+    DIAGNOSTICS_TOKEN=<token> python3 benchmark/load_test.py --endpoint /api/json --profile-seconds 10
+"""
+
+import argparse
+import os
+import statistics
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+BASE_URL = "http://localhost:5001"
+
+
+def parse_args():
+    """Parse the command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Run a concurrent load test against the backend API.")
+    parser.add_argument("--base-url", default=BASE_URL, help="Backend base URL.")
+    parser.add_argument(
+        "--endpoint",
+        action="append",
+        help="Endpoint to request, can be repeated. Defaults to /api/json.",
+    )
+    parser.add_argument("--concurrency", type=int, default=10, help="Number of concurrent workers.")
+    parser.add_argument("--duration", type=float, default=30, help="Length of the run in seconds.")
+    parser.add_argument(
+        "--ignore-retry-after",
+        action="store_true",
+        help="Retry immediately after a 503 instead of waiting for its Retry-After header.",
+    )
+    parser.add_argument(
+        "--health-probe",
+        action="store_true",
+        help="Poll /api/health every 0.5s during the run and report its latency separately.",
+    )
+    parser.add_argument(
+        "--profile-seconds",
+        type=int,
+        default=0,
+        help="Capture a CPU profile of this many seconds at the start of the run.",
+    )
+    parser.add_argument(
+        "--heap-snapshot",
+        action="store_true",
+        help="Take a heap snapshot once the run has finished.",
+    )
+    parser.add_argument(
+        "--token",
+        default=os.environ.get("DIAGNOSTICS_TOKEN"),
+        help="Diagnostics bearer token. Defaults to the DIAGNOSTICS_TOKEN environment variable.",
+    )
+    parser.add_argument("--output-dir", default="captures", help="Directory to save captures to.")
+    return parser.parse_args()
+
+
+def diagnostics_request(args, method, path, **kwargs):
+    """Send a request to a backend diagnostics endpoint.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+        method (str): The HTTP method.
+        path (str): The diagnostics endpoint path.
+        **kwargs: Extra arguments passed to requests.request.
+
+    Returns:
+        requests.Response: The response.
+    """
+    return requests.request(
+        method,
+        f"{args.base_url}{path}",
+        headers={"Authorization": f"Bearer {args.token}"},
+        **kwargs,
+    )
+
+
+def save_capture(args, response, suffix):
+    """Save a diagnostics capture to the output directory.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+        response (requests.Response): The streamed capture response.
+        suffix (str): The file extension, e.g. "cpuprofile".
+
+    Returns:
+        str: The path of the saved file.
+    """
+    os.makedirs(args.output_dir, exist_ok=True)
+    path = os.path.join(args.output_dir, f"backend-{int(time.time())}.{suffix}")
+    with open(path, "wb") as capture_file:
+        for chunk in response.iter_content(chunk_size=1024 * 1024):
+            capture_file.write(chunk)
+    return path
+
+
+def capture_cpu_profile(args):
+    """Capture a CPU profile while the load test runs.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+    """
+    response = diagnostics_request(
+        args,
+        "POST",
+        "/api/diagnostics/cpu-profile",
+        params={"seconds": args.profile_seconds},
+        timeout=args.profile_seconds + 30,
+        stream=True,
+    )
+    if response.status_code != 200:
+        print(f"CPU profile failed with status {response.status_code}: {response.text}")
+        return
+    print(f"Saved CPU profile to {save_capture(args, response, 'cpuprofile')}")
+
+
+def capture_heap_snapshot(args):
+    """Take a heap snapshot of the backend.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+    """
+    response = diagnostics_request(args, "POST", "/api/diagnostics/heap-snapshot", timeout=300, stream=True)
+    if response.status_code != 200:
+        print(f"Heap snapshot failed with status {response.status_code}: {response.text}")
+        return
+    print(f"Saved heap snapshot to {save_capture(args, response, 'heapsnapshot')}")
+
+
+def print_slow_requests(args):
+    """Print the stage timings of the slow requests recorded by the backend.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+    """
+    response = diagnostics_request(args, "GET", "/api/diagnostics/slow-requests", timeout=10)
+    if response.status_code != 200:
+        print(f"Fetching slow requests failed with status {response.status_code}")
+        return
+
+    slow_requests = response.json()["requests"]
+    print(f"\nSlow requests recorded by the backend: {len(slow_requests)}")
+    for record in slow_requests[:10]:
+        stages = ", ".join(f"{name}={ms:.1f}ms" for name, ms in record["stages_ms"].items())
+        print(f"  {record['duration_ms']:.1f}ms {record['status']} {record['path']} ({stages})")
+
+
+def run_load(args, endpoints):
+    """Request the endpoints from concurrent workers until the duration has passed.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+        endpoints (list[str]): The endpoints to request, round robin per worker.
+
+    Returns:
+        dict: Per endpoint lists of (status code, latency in ms).
+    """
+    results = defaultdict(list)
+    lock = threading.Lock()
+    deadline = time.monotonic() + args.duration
+
+    def worker(worker_id):
+        session = requests.Session()
+        count = worker_id
+        while time.monotonic() < deadline:
+            endpoint = endpoints[count % len(endpoints)]
+            count += 1
+            start = time.perf_counter()
+            retry_after = 0
+            try:
+                response = session.get(f"{args.base_url}{endpoint}", timeout=60)
+                status = response.status_code
+                header = response.headers.get("Retry-After", "")
+                if status == 503 and header.isdigit() and not args.ignore_retry_after:
+                    retry_after = int(header)
+            except requests.RequestException:
+                status = "error"
+            latency = (time.perf_counter() - start) * 1000
+            with lock:
+                results[endpoint].append((status, latency))
+            # Back off like a well behaved client when the backend is shedding load
+            time.sleep(min(retry_after, max(0, deadline - time.monotonic())))
+
+    def health_probe():
+        session = requests.Session()
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            try:
+                status = session.get(f"{args.base_url}/api/health", timeout=10).status_code
+            except requests.RequestException:
+                status = "error"
+            latency = (time.perf_counter() - start) * 1000
+            with lock:
+                results["/api/health (probe)"].append((status, latency))
+            time.sleep(0.5)
+
+    with ThreadPoolExecutor(max_workers=args.concurrency + 1) as executor:
+        for worker_id in range(args.concurrency):
+            executor.submit(worker, worker_id)
+        if args.health_probe:
+            executor.submit(health_probe)
+
+    return results
+
+
+def print_results(results, duration):
+    """Print latency percentiles and status code counts per endpoint.
+
+    Args:
+        results (dict): Per endpoint lists of (status code, latency in ms).
+        duration (float): Length of the run in seconds.
+    """
+    for endpoint, samples in results.items():
+        latencies = sorted(latency for _, latency in samples)
+        statuses = defaultdict(int)
+        for status, _ in samples:
+            statuses[status] += 1
+
+        percentiles = statistics.quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else latencies * 99
+        print(f"\n{endpoint}")
+        print(f"  requests: {len(samples)} ({len(samples) / duration:.1f}/s)")
+        print(f"  statuses: {dict(statuses)}")
+        print(
+            f"  latency ms: p50={percentiles[49]:.1f} p95={percentiles[94]:.1f} "
+            f"p99={percentiles[98]:.1f} max={latencies[-1]:.1f}"
+        )
+
+
+def main():
+    """Run the load test and any requested diagnostics captures."""
+    args = parse_args()
+    endpoints = args.endpoint or ["/api/json"]
+
+    profiler = None
+    if args.profile_seconds:
+        profiler = threading.Thread(target=capture_cpu_profile, args=(args,))
+        profiler.start()
+
+    print(f"Running {args.concurrency} workers for {args.duration}s against {', '.join(endpoints)}")
+    results = run_load(args, endpoints)
+    print_results(results, args.duration)
+
+    if profiler:
+        profiler.join()
+    if args.heap_snapshot:
+        capture_heap_snapshot(args)
+    if args.token:
+        print_slow_requests(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+This module runs a local stand-in for S3 to load test the backend without AWS.
+
+It serves synthetic repositories.json, new_project_data.json and
+onsRadarSkeleton.json objects from any bucket, with an optional delay to
+simulate S3 latency. Objects written with PUT are kept in memory.
+
+Start the backend against it with:
+    S3_ENDPOINT=http://localhost:9000 AWS_ACCESS_KEY_ID=test AWS_SECRET_ACCESS_KEY=test npm start
+
+Example:
+    python3 benchmark/s3_stub.py --repositories 20000 --latency-ms 100
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+LANGUAGES = ["Python", "JavaScript", "TypeScript", "Java", "Go", "R", "Shell", "HCL", "HTML", "CSS"]
+VISIBILITIES = ["PUBLIC", "PRIVATE", "INTERNAL"]
+
+
+def parse_args():
+    """Parse the command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Run a local S3 stand-in for load testing the backend.")
+    parser.add_argument("--port", type=int, default=9000, help="Port to listen on.")
+    parser.add_argument("--repositories", type=int, default=5000, help="Number of repositories to generate.")
+    parser.add_argument("--projects", type=int, default=200, help="Number of projects to generate.")
+    parser.add_argument("--latency-ms", type=int, default=50, help="Delay added to every request.")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the generated data.")
+    return parser.parse_args()
+
+
+def generate_repositories(count):
+    """Generate a repositories.json object.
+
+    Args:
+        count (int): The number of repositories.
+
+    Returns:
+        dict: The repositories data.
+    """
+    now = datetime.now(timezone.utc)
+    repositories = []
+    for index in range(count):
+        languages = random.sample(LANGUAGES, random.randint(1, 4))
+        weights = [random.random() for _ in languages]
+        repositories.append(
+            {
+                "name": f"repo-{index}",
+                "url": f"https://github.com/ONSdigital/repo-{index}",
+                "visibility": random.choice(VISIBILITIES),
+                "is_archived": random.random() < 0.2,
+                "last_commit": (now - timedelta(days=random.randint(0, 1500))).isoformat(),
+                "technologies": {
+                    "languages": [
+                        {
+                            "name": name,
+                            "percentage": round(weight / sum(weights) * 100, 3),
+                            "size": random.randint(1000, 5000000),
+                        }
+                        for name, weight in zip(languages, weights)
+                    ]
+                },
+            }
+        )
+    return {"repositories": repositories, "metadata": {"last_updated": now.isoformat()}}
+
+
+def generate_projects(count):
+    """Generate a new_project_data.json object.
+
+    Args:
+        count (int): The number of projects.
+
+    Returns:
+        dict: The project data.
+    """
+
+    def options():
+        return {"main": random.sample(LANGUAGES, 1), "others": random.sample(LANGUAGES, 2)}
+
+    projects = []
+    for index in range(count):
+        projects.append(
+            {
+                "user": [{"email": f"user{index}@ons.gov.uk", "roles": ["Technical Contact"]}],
+                "details": [
+                    {
+                        "name": f"Project {index}",
+                        "short_name": f"P{index}",
+                        "documentation_link": [f"https://example.com/docs/{index}"],
+                    }
+                ],
+                "source_control": [
+                    {
+                        "type": "GitHub",
+                        "links": [{"url": f"https://github.com/ONSdigital/repo-{index}"}],
+                    }
+                ],
+                "architecture": {
+                    "languages": options(),
+                    "frameworks": options(),
+                    "hosting": {"type": ["Cloud"], "details": ["AWS"]},
+                    "cicd": options(),
+                    "database": options(),
+                    "infrastructure": options(),
+                },
+                "supporting_tools": {
+                    "project_tracking": "Jira",
+                    "incident_management": "PagerDuty",
+                    "code_editors": options(),
+                    "communication": options(),
+                    "collaboration": options(),
+                    "documentation": options(),
+                    "user_interface": options(),
+                    "diagrams": options(),
+                },
+            }
+        )
+    return {"projects": projects}
+
+
+def generate_radar():
+    """Generate an onsRadarSkeleton.json object.
+
+    Returns:
+        dict: The tech radar data.
+    """
+    return {
+        "title": "ONS Tech Radar",
+        "quadrants": [{"id": str(index), "name": name} for index, name in enumerate(
+            ["Languages", "Frameworks", "Supporting Tools", "Infrastructure"], start=1
+        )],
+        "rings": [{"id": ring, "name": ring.upper()} for ring in ["adopt", "trial", "assess", "hold"]],
+        "entries": [
+            {
+                "id": name.lower(),
+                "title": name,
+                "quadrant": "1",
+                "timeline": [{"moved": 0, "ringId": "adopt", "date": "2024-01-01", "description": "Generated"}],
+            }
+            for name in LANGUAGES
+        ],
+    }
+
+
+def make_handler(objects, latency_ms):
+    """Create a request handler serving the given objects.
+
+    Args:
+        objects (dict): Object bodies keyed by object key.
+        latency_ms (int): Delay added to every request.
+
+    Returns:
+        type: The request handler class.
+    """
+
+    class S3StubHandler(BaseHTTPRequestHandler):
+        """Serves path-style S3 GetObject and PutObject requests."""
+
+        protocol_version = "HTTP/1.1"
+
+        def object_key(self):
+            """Return the object key from a /<bucket>/<key> path, ignoring the bucket and query."""
+            return urlparse(self.path).path.lstrip("/").split("/", 1)[-1]
+
+        def send_body(self, status, body):
+            """Send a response with an S3 style ETag."""
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", f'"{hashlib.md5(body).hexdigest()}"')  # noqa: S324
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            """Serve an object."""
+            time.sleep(latency_ms / 1000)
+            body = objects.get(self.object_key())
+            if body is None:
+                self.send_body(404, b'{"error": "NoSuchKey"}')
+                return
+            self.send_body(200, body)
+
+        def do_PUT(self):  # pylint: disable=invalid-name
+            """Store an object."""
+            time.sleep(latency_ms / 1000)
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            objects[self.object_key()] = body
+            self.send_body(200, b"")
+
+        def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+            """Silence per-request logging."""
+
+    return S3StubHandler
+
+
+def main():
+    """Generate the objects and serve them until interrupted."""
+    args = parse_args()
+    random.seed(args.seed)
+
+    objects = {
+        "repositories.json": json.dumps(generate_repositories(args.repositories)).encode(),
+        "new_project_data.json": json.dumps(generate_projects(args.projects)).encode(),
+        "onsRadarSkeleton.json": json.dumps(generate_radar()).encode(),
+    }
+    for key, body in objects.items():
+        print(f"{key}: {len(body) / 1024 / 1024:.1f} MB")
+
+    server = ThreadingHTTPServer(("localhost", args.port), make_handler(objects, args.latency_ms))
+    print(f"S3 stand-in listening on http://localhost:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()